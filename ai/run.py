@@ -1,127 +1,548 @@
 import asyncio
+import hashlib
+import logging
 import os
+import time
 import warnings
 from functools import wraps
-from typing import Optional
-
-from flask import Flask, request, jsonify
-from flask_cors import CORS
-from supabase import create_client, Client
-
-from crews.random_phrase_crew.crew import RandomPhraseCrew
+from typing import Any, NamedTuple, Optional
+
+import httpx
+import jwt
+import orjson
+import uvicorn
+from cachetools import TTLCache
+from opentelemetry import trace
+from pydantic import BaseModel, ConfigDict, ValidationError
+from quart import Quart, Response, request
+from quart_cors import cors
+
+from crews.base.llm import awarm_connections, warm_connections
+from crews.base.pool import CrewPool
+from crews.random_phrase_crew.crew import RandomPhraseBatchCrew, RandomPhraseCrew
 from crews.random_phrase_crew.schemas import PhraseOutput
+from crews.random_phrase_crew.stream import stream_phrase
 
-from lib.tracer import traceable
+from lib.batcher import AsyncBatcher
+from lib.log import setup_logging
+from lib.shared_cache import SharedCache
+from lib.tracer import traceable, tracer
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
-# Initialize Flask app
-app = Flask(__name__)
+setup_logging()
+logger = logging.getLogger(__name__)
+
+# Initialize Quart app (debug mode is opt-in, it is far too slow for production)
+DEBUG = os.getenv("QUART_DEBUG", "false").lower() == "true"
+app = Quart(__name__)
+app.config["DEBUG"] = DEBUG
 
 # Configure CORS - allow requests from localhost frontend
-CORS(app, resources={
-    r"/api/*": {
-        "origins": [
-            "http://localhost:5173",  # Vite dev server
-            "http://localhost:3000",  # Alternative port
-            "http://127.0.0.1:5173",
-            "http://127.0.0.1:3000"
-        ],
-        "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-        "allow_headers": ["Content-Type", "Authorization"],
-        "supports_credentials": True
-    }
-})
+app = cors(
+    app,
+    allow_origin=[
+        "http://localhost:5173",  # Vite dev server
+        "http://localhost:3000",  # Alternative port
+        "http://127.0.0.1:5173",
+        "http://127.0.0.1:3000"
+    ],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
+    allow_credentials=True
+)
+
+
+def json_response(data: Any, status: int = 200) -> Response:
+    """
+    Build a JSON response.
+
+    Pydantic models are serialized directly with model_dump_json(), skipping
+    the intermediate dict; anything else is serialized with orjson.
+    """
+    body = data.model_dump_json() if isinstance(data, BaseModel) else orjson.dumps(data)
+    return Response(body, status=status, mimetype="application/json")
+
+
+async def read_json() -> Any:
+    """Parse the request body as JSON with orjson, or return None if it isn't valid JSON."""
+    body = await request.get_data()
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return None
+
+
+async def read_words() -> list[Any]:
+    """
+    Read the non-empty "words" array from the request body.
+
+    Raises:
+        ValueError: If the body doesn't contain a valid "words" array
+    """
+    data = await read_json()
+
+    if not isinstance(data, dict) or "words" not in data:
+        raise ValueError("Request body must include 'words' array")
+
+    words = data.get("words", [])
+
+    if not isinstance(words, list) or len(words) == 0:
+        raise ValueError("'words' must be a non-empty array")
+
+    return words
 
-# Initialize Supabase client
+
+def sse_event(data: str, event: Optional[str] = None) -> str:
+    """Format a Server-Sent Events message."""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {data}\n\n"
+
+
+# Built crews are reused across requests instead of being rebuilt on every call
+CREW_POOL_SIZE = int(os.getenv("CREW_POOL_SIZE", 8))
+random_phrase_crews = CrewPool(lambda: RandomPhraseCrew().crew(), size=CREW_POOL_SIZE)
+random_phrase_batch_crews = CrewPool(lambda: RandomPhraseBatchCrew().crew(), size=CREW_POOL_SIZE)
+
+# Optional cache of generated phrases keyed by (words, user context hash). The
+# endpoint is meant to be random and users often get the same words again, so
+# a cached phrase is repeated verbatim until it expires. Off unless
+# PHRASE_CACHE_TTL (seconds) is set; keep it short.
+PHRASE_CACHE_TTL = int(os.getenv("PHRASE_CACHE_TTL", 0))
+PHRASE_CACHE_SIZE = int(os.getenv("PHRASE_CACHE_SIZE", 10_000))
+_phrase_cache: Optional[TTLCache] = (
+    TTLCache(maxsize=PHRASE_CACHE_SIZE, ttl=PHRASE_CACHE_TTL) if PHRASE_CACHE_TTL > 0 else None
+)
+
+# Redis cache shared by all workers, sitting behind the in-process caches.
+# Disabled unless REDIS_URL is set.
+shared_cache = SharedCache(os.getenv("REDIS_URL"), timeout=float(os.getenv("REDIS_TIMEOUT", 0.25)))
+PROFILE_CACHE_TTL = int(os.getenv("PROFILE_CACHE_TTL", 60))
+
+# Supabase REST endpoints (GoTrue for auth, PostgREST for tables)
 SUPABASE_URL = os.getenv("SUPABASE_URL", "http://127.0.0.1:54321")
 SUPABASE_ANON_KEY = os.getenv("SUPABASE_ANON_KEY", "")
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
+
+# Shared async HTTP client, so connections to Supabase stay pooled and requests
+# never block the event loop. Opened and closed with the server lifecycle.
+_supabase_http: Optional[httpx.AsyncClient] = None
+
+
+@app.before_serving
+async def open_supabase_http():
+    global _supabase_http
+    _supabase_http = httpx.AsyncClient(
+        base_url=SUPABASE_URL,
+        headers={"apikey": SUPABASE_ANON_KEY},
+        http2=True,
+        timeout=5,
+    )
+
+
+@app.after_serving
+async def close_supabase_http():
+    if _supabase_http is not None:
+        await _supabase_http.aclose()
+    await shared_cache.close()
+
+
+def supabase_http() -> httpx.AsyncClient:
+    """Return the shared Supabase HTTP client."""
+    if _supabase_http is None:
+        raise RuntimeError("Supabase HTTP client is only available while the app is serving")
+    return _supabase_http
+
+
+WARMUP_TIMEOUT = float(os.getenv("WARMUP_TIMEOUT", 10))
+
+
+async def _warm_crews():
+    await asyncio.to_thread(random_phrase_crews.warm)
+    await asyncio.to_thread(random_phrase_batch_crews.warm)
+
+
+async def _warm_llm():
+    # Crews call LiteLLM synchronously, the stream endpoint asynchronously
+    await asyncio.gather(asyncio.to_thread(warm_connections), awarm_connections())
+
+
+async def _warm_supabase():
+    # RLS returns no rows for the anon key; this only opens the connection
+    await supabase_http().get("/rest/v1/profiles", params={"select": "id", "limit": "1"})
+
+
+@app.before_serving
+async def warm_up():
+    """
+    Pay one-time startup costs before the first request does.
+
+    Builds the crews, opens the LLM and Supabase connections, and never fails
+    or holds up startup for more than WARMUP_TIMEOUT seconds if an upstream
+    is down.
+    """
+    steps = {"crews": _warm_crews(), "llm": _warm_llm(), "supabase": _warm_supabase()}
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(*steps.values(), return_exceptions=True),
+            timeout=WARMUP_TIMEOUT,
+        )
+    except asyncio.TimeoutError:
+        logger.warning("Warm-up did not finish within %ss", WARMUP_TIMEOUT)
+        return
+
+    for name, result in zip(steps, results):
+        if isinstance(result, Exception):
+            logger.warning("Warm-up of %s failed: %s", name, result)
+
+
+class AuthUser(BaseModel):
+    """Subset of the Supabase auth user used by the endpoints."""
+
+    model_config = ConfigDict(extra="allow")
+
+    id: str
+    email: Optional[str] = None
+
+
+# Optional local JWT verification with the project's HS256 secret. This skips the
+# GoTrue round-trip entirely, but a token revoked in Supabase (e.g. on sign-out)
+# stays valid here until it expires, so it has to be enabled explicitly.
+AUTH_VERIFY_LOCALLY = os.getenv("AUTH_VERIFY_LOCALLY", "false").lower() == "true"
+SUPABASE_JWT_SECRET = os.getenv("SUPABASE_JWT_SECRET", "")
+if AUTH_VERIFY_LOCALLY and not SUPABASE_JWT_SECRET:
+    raise RuntimeError("AUTH_VERIFY_LOCALLY requires SUPABASE_JWT_SECRET to be set")
+
+# Cache of validated users keyed by token hash, so repeat requests skip the GoTrue round-trip
+AUTH_CACHE_TTL = int(os.getenv("AUTH_CACHE_TTL", 60))
+_auth_cache: TTLCache = TTLCache(maxsize=10_000, ttl=AUTH_CACHE_TTL)
+
+
+def _digest(value: str) -> str:
+    return hashlib.blake2b(value.encode(), digest_size=16).hexdigest()
+
+
+def _unverified_claims(token: str) -> dict[str, Any]:
+    """
+    Decode the JWT payload without verifying its signature.
+
+    Only used for hints (cache TTL, prefetching the profile); the token is
+    still verified before any of it is trusted.
+    """
+    try:
+        return jwt.decode(token, options={"verify_signature": False})
+    except jwt.PyJWTError:
+        return {}
+
+
+def _token_expiry(token: str, now: float) -> float:
+    """Return the time until which a validated token may be served from cache."""
+    expires_at = now + AUTH_CACHE_TTL
+    exp = _unverified_claims(token).get("exp")
+    if isinstance(exp, (int, float)):
+        return min(expires_at, exp)
+    return expires_at
+
+
+async def authenticate(token: str) -> AuthUser:
+    """
+    Validate a JWT with Supabase, reusing the result for repeat requests.
+
+    With AUTH_VERIFY_LOCALLY enabled the signature and claims are checked
+    against SUPABASE_JWT_SECRET instead, without calling Supabase.
+
+    Args:
+        token: The raw JWT from the Authorization header
+
+    Returns:
+        The Supabase user the token belongs to
+
+    Raises:
+        jwt.InvalidTokenError: If local verification rejects the token
+        httpx.HTTPStatusError: If Supabase rejects the token
+    """
+    if AUTH_VERIFY_LOCALLY:
+        claims = jwt.decode(
+            token,
+            SUPABASE_JWT_SECRET,
+            algorithms=["HS256"],
+            audience="authenticated",
+            options={"require": ["exp", "sub"]},
+        )
+        return AuthUser(id=claims["sub"], email=claims.get("email"))
+
+    key = _digest(token)
+    now = time.time()
+
+    cached = _auth_cache.get(key)
+    if cached is not None:
+        user, expires_at = cached
+        if expires_at > now:
+            return user
+        _auth_cache.pop(key, None)
+
+    response = await supabase_http().get("/auth/v1/user", headers={"Authorization": f"Bearer {token}"})
+    response.raise_for_status()
+    user = AuthUser.model_validate(response.json())
+
+    expires_at = _token_expiry(token, now)
+    if expires_at > now:
+        _auth_cache[key] = (user, expires_at)
+    return user
+
+
+PROFILE_FIELDS = ("context",)
+
+
+async def get_user_profile_fields(
+    user_id: str,
+    user_token: str,
+    cols: tuple[str, ...] = PROFILE_FIELDS,
+) -> Optional[dict[str, Any]]:
+    """
+    Fetch selected profile columns from Supabase in a single query.
+
+    Results are kept in the shared cache for PROFILE_CACHE_TTL seconds.
+
+    Args:
+        user_id: The user's UUID
+        user_token: The user's JWT, so the query passes Row-Level Security
+        cols: Profile columns to select
+
+    Returns:
+        Mapping of column name to value, or None if not found
+    """
+    cache_key = f"profile:{user_id}:{','.join(cols)}"
+    cached = await shared_cache.get(cache_key)
+    if cached is not None:
+        return orjson.loads(cached)
+
+    try:
+        response = await supabase_http().get(
+            "/rest/v1/profiles",
+            params={"id": f"eq.{user_id}", "select": ",".join(cols)},
+            headers={
+                "Authorization": f"Bearer {user_token}",
+                # Return a single object rather than an array, like .single()
+                "Accept": "application/vnd.pgrst.object+json",
+            },
+        )
+        response.raise_for_status()
+        profile = response.json() or None
+    except Exception as e:
+        logger.warning("Error fetching user profile: %s", e)
+        return None
+
+    await shared_cache.set(cache_key, orjson.dumps(profile), ttl=PROFILE_CACHE_TTL)
+    return profile
+
+
+def _bearer_token(auth_header: str) -> Optional[str]:
+    """
+    Extract the token from a "Bearer <token>" Authorization header.
+
+    A bare token without a scheme is accepted as well. Returns None if the
+    header is malformed.
+    """
+    scheme, _, token = auth_header.strip().partition(" ")
+    if not token:
+        # "Bearer" on its own is a scheme with a missing token, not a token
+        if scheme.lower() == "bearer":
+            return None
+        return scheme or None
+    if scheme.lower() != "bearer":
+        return None
+    return token.strip() or None
 
 
 def require_auth(f):
     """
     Decorator to require authentication for endpoints.
-    Validates the JWT token from the Authorization header.
+    Validates the JWT token from the Authorization header and stores it as
+    `request.auth_token`, so handlers never parse the header themselves.
+
+    The user's profile fetch is started concurrently with token validation,
+    using the token's unverified `sub` claim, and exposed as the
+    `request.profile_task` task once the token is verified to belong to that
+    user. Handlers await it only when they need the profile; it is cancelled
+    if they return without doing so.
     """
     @wraps(f)
     async def decorated_function(*args, **kwargs):
         auth_header = request.headers.get("Authorization")
 
         if not auth_header:
-            return jsonify({"error": "Authorization header is required"}), 401
+            return json_response({"error": "Authorization header is required"}, 401)
 
-        # Extract token from "Bearer <token>" format
-        try:
-            token = auth_header.split(" ")[1] if " " in auth_header else auth_header
-        except IndexError:
-            return jsonify({"error": "Invalid authorization header format"}), 401
+        token = _bearer_token(auth_header)
+        if token is None:
+            return json_response({"error": "Invalid authorization header format"}, 401)
+
+        claimed_user_id = _unverified_claims(token).get("sub")
+        profile_task = None
+        if claimed_user_id:
+            profile_task = asyncio.create_task(get_user_profile_fields(claimed_user_id, token))
 
         try:
-            # Verify the JWT token with Supabase
-            user_response = supabase.auth.get_user(token)
-            request.user = user_response.user
+            # Verify the JWT token with Supabase (cached per token)
+            user = await authenticate(token)
         except Exception as e:
-            return jsonify({"error": f"Authentication failed: {str(e)}"}), 401
+            if profile_task:
+                profile_task.cancel()
+            return json_response({"error": f"Authentication failed: {str(e)}"}, 401)
 
-        return await f(*args, **kwargs)
+        if user.id != claimed_user_id:
+            if profile_task:
+                profile_task.cancel()
+            profile_task = asyncio.create_task(get_user_profile_fields(user.id, token))
+
+        request.user = user
+        request.auth_token = token
+        request.profile_task = profile_task
+
+        try:
+            return await f(*args, **kwargs)
+        finally:
+            if not profile_task.done():
+                profile_task.cancel()
 
     return decorated_function
 
 
-async def get_user_context(user_id: str) -> Optional[str]:
+async def kickoff_random_phrase(words: list[str], user_context: str) -> tuple[PhraseOutput, bool]:
     """
-    Fetch user context from Supabase.
+    Run the RandomPhraseCrew for a single request.
 
-    Args:
-        user_id: The user's UUID
+    Returns the phrase and whether it came from the crew's structured output
+    (False when the raw crew output had to be wrapped as a fallback).
+    """
+    inputs = {
+        'words': orjson.dumps(words).decode(),
+        'user_context': orjson.dumps(user_context).decode()
+    }
 
-    Returns:
-        User context string or None if not found
+    result = await random_phrase_crews.kickoff_async(inputs=inputs)
+
+    # CrewAI returns a result with a .pydantic attribute containing the Pydantic model
+    if getattr(result, 'pydantic', None) is not None:
+        return result.pydantic, True
+
+    # Fallback - return a basic PhraseOutput
+    return PhraseOutput(phrase=str(result), words=words), False
+
+
+class PhraseRequest(NamedTuple):
+    """One phrase request queued on the phrase batcher."""
+    user_id: str
+    words: list[str]
+    user_context: str
+    # Span of the request's trace, linked from the batch span it ends up in
+    span_context: trace.SpanContext
+
+
+async def kickoff_random_phrase_batch(
+    requests: list[PhraseRequest],
+) -> list[tuple[PhraseOutput, bool] | BaseException]:
     """
-    try:
-        # Fetch user context from the profiles table
-        response = supabase.table("profiles").select("context").eq("id", user_id).single().execute()
+    Generate phrases for a batch of requests.
 
-        if response.data:
-            return response.data.get("context", "")
-        return None
-    except Exception as e:
-        print(f"Error fetching user context: {e}")
-        return None
+    The batcher only groups requests from the same user with the same
+    context. Words and profile context are both user-entered, so one user's
+    input never ends up in a prompt built for another.
+
+    A batch of one uses the single-request crew. Larger batches are answered by
+    one RandomPhraseBatchCrew run; if that run fails or its output doesn't line
+    up with the requests, each request falls back to the single-request crew
+    and fails on its own.
+
+    A batch of one runs inside its request's trace. A larger batch runs in a
+    span of its own, linked to the span of every request it serves.
+    """
+    if len(requests) == 1:
+        single = requests[0]
+        return [await kickoff_random_phrase(single.words, single.user_context)]
+
+    with tracer.start_as_current_span(
+        "kickoff_random_phrase_batch",
+        links=[trace.Link(r.span_context) for r in requests],
+        attributes={"batch.size": len(requests)},
+    ):
+        user_context = requests[0].user_context
+        inputs = {
+            'word_lists': orjson.dumps([r.words for r in requests]).decode(),
+            'user_context': orjson.dumps(user_context).decode()
+        }
+
+        try:
+            result = await random_phrase_batch_crews.kickoff_async(inputs=inputs)
+        except Exception:
+            logger.warning("Batch phrase generation failed, falling back per request", exc_info=True)
+            result = None
+
+        batch = getattr(result, 'pydantic', None)
+        if batch is not None and len(batch.phrases) == len(requests):
+            return [(phrase, True) for phrase in batch.phrases]
+
+        return list(await asyncio.gather(
+            *(kickoff_random_phrase(r.words, user_context) for r in requests),
+            return_exceptions=True,
+        ))
+
+
+# Concurrent phrase requests from the same user (and context) are grouped into
+# a single crew run
+phrase_batcher = AsyncBatcher(
+    kickoff_random_phrase_batch,
+    max_batch=int(os.getenv("PHRASE_BATCH_SIZE", 16)),
+    max_latency_ms=float(os.getenv("PHRASE_BATCH_LATENCY_MS", 25)),
+    key=lambda request: (request.user_id, request.user_context),
+)
 
 
 @traceable
-async def generate_random_phrase(words: list[str], user_context: str) -> PhraseOutput:
+async def generate_random_phrase(words: list[str], user_context: str, user_id: str) -> PhraseOutput:
     """
     Generate a random phrase using the RandomPhraseCrew.
 
     Args:
         words: List of words to use in the phrase
         user_context: User context to personalize the phrase
+        user_id: ID of the requesting user; only their own requests share a batch
 
     Returns:
         PhraseOutput with phrase and words used
     """
-    inputs = {
-        'words': jsonify(words).get_data(as_text=True),
-        'user_context': jsonify(user_context).get_data(as_text=True)
-    }
-
-    result = await RandomPhraseCrew().crew().kickoff_async(inputs=inputs)
-
-    # CrewAI returns a result with a .pydantic attribute containing the Pydantic model
-    if hasattr(result, 'pydantic'):
-        return result.pydantic
-
-    # Fallback - return a basic PhraseOutput
-    return PhraseOutput(phrase=str(result), words=words)
+    phrase_request = PhraseRequest(user_id, words, user_context, trace.get_current_span().get_span_context())
+
+    if _phrase_cache is None:
+        result, _ = await phrase_batcher.submit(phrase_request)
+        return result
+
+    words_json = orjson.dumps(words)
+    context_digest = _digest(user_context)
+    cache_key = (words_json, context_digest)
+    cached = _phrase_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    shared_key = f"phrase:{_digest(words_json.decode())}:{context_digest}"
+    shared = await shared_cache.get(shared_key)
+    if shared is not None:
+        result = PhraseOutput.model_validate_json(shared)
+    else:
+        result, structured = await phrase_batcher.submit(phrase_request)
+        # Don't pin a raw fallback phrase for the cache lifetime
+        if not structured:
+            return result
+        await shared_cache.set(shared_key, result.model_dump_json().encode(), ttl=PHRASE_CACHE_TTL)
+
+    _phrase_cache[cache_key] = result
+    return result
 
 
 @app.route("/health", methods=["GET"])
 async def health():
     """Health check endpoint."""
-    return jsonify({"status": "healthy"}), 200
+    return json_response({"status": "healthy"})
 
 
 @app.route("/api/random-phrase", methods=["POST"])
@@ -146,30 +567,82 @@ async def get_random_phrase():
     """
     try:
         # Get words from request body
-        data = request.get_json()
+        try:
+            words = await read_words()
+        except ValueError as e:
+            return json_response({"error": str(e)}, 400)
 
-        if not data or "words" not in data:
-            return jsonify({"error": "Request body must include 'words' array"}), 400
+        # The profile fetch started alongside authentication
+        profile = await request.profile_task
+        user_context = (profile or {}).get("context")
 
-        words = data.get("words", [])
+        # Generate the phrase
+        result = await generate_random_phrase(words, user_context or "", request.user.id)
 
-        if not isinstance(words, list) or len(words) == 0:
-            return jsonify({"error": "'words' must be a non-empty array"}), 400
+        return json_response(result)
 
-        # Get user context from Supabase
-        user_id = request.user.id
-        user_context = await get_user_context(user_id)
+    except Exception as e:
+        logger.exception("Error in /api/random-phrase")
+        return json_response({"error": f"An error occurred: {str(e)}"}, 500)
 
-        # Generate the phrase
-        result = await generate_random_phrase(words, user_context or "")
 
-        return jsonify(result.model_dump()), 200
+@app.route("/api/random-phrase/stream", methods=["POST"])
+@require_auth
+async def stream_random_phrase():
+    """
+    Stream a random phrase as Server-Sent Events while the LLM generates it.
+
+    Request body and headers are the same as /api/random-phrase.
 
-    except Exception as e:
-        return jsonify({"error": f"An error occurred: {str(e)}"}), 500
+    Response (text/event-stream):
+        data: {"delta": "<next chunk of the JSON output>"}
+        ...
+        event: done
+        data: {"phrase": "generated phrase", "words": ["word1", "word2"]}
+
+    If generation fails midway, an `error` event with {"error": "..."} is sent instead of `done`.
+    """
+    try:
+        words = await read_words()
+    except ValueError as e:
+        return json_response({"error": str(e)}, 400)
+
+    profile = await request.profile_task
+    user_context = (profile or {}).get("context") or ""
+
+    async def events():
+        text = ""
+        try:
+            async for delta in stream_phrase(orjson.dumps(words).decode(), orjson.dumps(user_context).decode()):
+                text += delta
+                yield sse_event(orjson.dumps({"delta": delta}).decode())
+
+            # Models sometimes wrap the JSON in a code fence
+            start, end = text.find("{"), text.rfind("}")
+            try:
+                result = PhraseOutput.model_validate_json(text[start:end + 1])
+            except ValidationError:
+                result = PhraseOutput(phrase=text.strip(), words=words)
+
+            yield sse_event(result.model_dump_json(), event="done")
+
+        except Exception as e:
+            logger.exception("Error in /api/random-phrase/stream")
+            yield sse_event(orjson.dumps({"error": f"An error occurred: {str(e)}"}).decode(), event="error")
+
+    return events(), 200, {"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
 
 
 if __name__ == "__main__":
-    # Run the Flask app
+    # Run the Quart app under uvicorn
     port = int(os.getenv("PORT", 8000))
-    app.run(host="0.0.0.0", port=port, debug=True)
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    uvicorn.run(
+        "run:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        log_level="debug" if DEBUG else "info",
+    )
@@ -1,8 +1,42 @@
 import os
+from functools import cache
+
 from crewai import LLM
+from litellm.llms.custom_httpx.http_handler import _get_httpx_client, get_async_httpx_client
+from litellm.types.utils import LlmProviders
 
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+GROQ_API_BASE = "https://api.groq.com/openai/v1"
+
+
+@cache
+def default_llm() -> LLM:
+    """Build the default LLM on first use."""
+    return LLM(api_key=GROQ_API_KEY, model="groq/llama-3.3-70b-versatile")
+
+
+# LiteLLM sends Groq requests through its own cached httpx handlers, keyed by
+# these params (see litellm.llms.custom_httpx.llm_http_handler)
+_LITELLM_CLIENT_PARAMS = {"ssl_verify": None}
+
+
+def warm_connections() -> None:
+    """
+    Open the connection LiteLLM reuses for crew kickoffs.
+
+    Lists models instead of running a completion, so warming up costs no
+    tokens. Does nothing without GROQ_API_KEY. Blocking; run it in a thread
+    from async code.
+    """
+    if not GROQ_API_KEY:
+        return
+    client = _get_httpx_client(params=dict(_LITELLM_CLIENT_PARAMS))
+    client.get(f"{GROQ_API_BASE}/models", headers={"Authorization": f"Bearer {GROQ_API_KEY}"})
 
-GROQ_LLM = LLM(api_key=GROQ_API_KEY, model="groq/llama-3.3-70b-versatile")
 
-DEFAULT_LLM = GROQ_LLM
+async def awarm_connections() -> None:
+    """Async counterpart of warm_connections, for the client used by streaming."""
+    if not GROQ_API_KEY:
+        return
+    client = get_async_httpx_client(LlmProviders.GROQ, params=dict(_LITELLM_CLIENT_PARAMS))
+    await client.get(f"{GROQ_API_BASE}/models", headers={"Authorization": f"Bearer {GROQ_API_KEY}"})
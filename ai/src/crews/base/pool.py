@@ -0,0 +1,38 @@
+import asyncio
+from typing import Any, Callable
+
+from crewai import Crew
+from crewai.crews.crew_output import CrewOutput
+
+
+class CrewPool:
+    """
+    Keeps built crews around for reuse across requests.
+
+    Building a crew parses its YAML config and instantiates agents and tasks,
+    so it is done once per pooled crew rather than per request. A Crew is not
+    safe to kick off concurrently (kickoff interpolates inputs into its tasks),
+    so each crew runs one kickoff at a time and at most `size` run at once.
+
+    Usage:
+        pool = CrewPool(lambda: MyCrew().crew(), size=4)
+        result = await pool.kickoff_async(inputs={...})
+    """
+
+    def __init__(self, factory: Callable[[], Crew], size: int):
+        self._factory = factory
+        self._idle: list[Crew] = []
+        self._semaphore = asyncio.Semaphore(size)
+
+    def warm(self, count: int = 1) -> None:
+        """Build crews ahead of time so the first requests don't pay for it."""
+        for _ in range(count - len(self._idle)):
+            self._idle.append(self._factory())
+
+    async def kickoff_async(self, inputs: dict[str, Any]) -> CrewOutput:
+        async with self._semaphore:
+            crew = self._idle.pop() if self._idle else self._factory()
+            try:
+                return await crew.kickoff_async(inputs=inputs)
+            finally:
+                self._idle.append(crew)
@@ -2,8 +2,8 @@ from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from typing import List
-from src.crews.base.llm import DEFAULT_LLM
-from src.crews.random_phrase_crew.schemas import PhraseOutput
+from crews.base.llm import default_llm
+from crews.random_phrase_crew.schemas import PhraseBatchOutput, PhraseOutput
 
 @CrewBase
 class RandomPhraseCrew():
@@ -14,7 +14,7 @@ class RandomPhraseCrew():
     def phrase_creator(self) -> Agent:
         return Agent(
             config=self.agents_config['phrase_creator'],
-            llm=DEFAULT_LLM
+            llm=default_llm()
         )
 
     @task
@@ -31,3 +31,32 @@ class RandomPhraseCrew():
             tasks=self.tasks,
             process=Process.sequential
         )
+
+
+@CrewBase
+class RandomPhraseBatchCrew():
+    """Generates phrases for several requests in a single LLM run."""
+    agents: List[BaseAgent]
+    tasks: List[Task]
+
+    @agent
+    def phrase_creator(self) -> Agent:
+        return Agent(
+            config=self.agents_config['phrase_creator'],
+            llm=default_llm()
+        )
+
+    @task
+    def phrase_batch_generation_task(self) -> Task:
+        return Task(
+            config=self.tasks_config['phrase_batch_generation_task'],
+            output_pydantic=PhraseBatchOutput
+        )
+
+    @crew
+    def crew(self) -> Crew:
+        return Crew(
+            agents=self.agents,
+            tasks=self.tasks,
+            process=Process.sequential
+        )
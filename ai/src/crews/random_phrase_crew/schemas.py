@@ -1,10 +1,13 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List
 
 
 class PhraseOutput(BaseModel):
     """Schema for the phrase generation output."""
 
+    # Frozen so cached instances can be shared between requests
+    model_config = ConfigDict(frozen=True)
+
     phrase: str = Field(
         ...,
         description="The generated phrase using the provided words"
@@ -13,3 +16,12 @@ class PhraseOutput(BaseModel):
         ...,
         description="List of words that were actually used in the generated phrase"
     )
+
+
+class PhraseBatchOutput(BaseModel):
+    """Schema for the batched phrase generation output."""
+
+    phrases: List[PhraseOutput] = Field(
+        ...,
+        description="One generated phrase per request, in the same order as the requests"
+    )
@@ -0,0 +1,70 @@
+from functools import cache
+from pathlib import Path
+from typing import AsyncIterator
+
+import litellm
+import yaml
+
+from crews.base.llm import default_llm
+
+CONFIG_DIR = Path(__file__).parent / "config"
+
+
+@cache
+def _phrase_config() -> tuple[dict, dict]:
+    """Load the phrase_creator agent and phrase_generation_task definitions."""
+    agents = yaml.safe_load((CONFIG_DIR / "agents.yaml").read_text())
+    tasks = yaml.safe_load((CONFIG_DIR / "tasks.yaml").read_text())
+    return agents["phrase_creator"], tasks["phrase_generation_task"]
+
+
+def phrase_messages(words: str, user_context: str) -> list[dict[str, str]]:
+    """
+    Build chat messages for the phrase task from the crew's YAML config, so
+    the streaming path uses the same prompt as RandomPhraseCrew.
+
+    Args:
+        words: JSON-encoded list of words
+        user_context: JSON-encoded user context
+    """
+    agent, task = _phrase_config()
+    system = (
+        f"You are {agent['role'].strip()}. {agent['backstory'].strip()}\n"
+        f"Your personal goal is: {agent['goal'].strip()}"
+    )
+    user = (
+        f"{task['description'].format(words=words, user_context=user_context).strip()}\n\n"
+        f"Expected output: {task['expected_output'].strip()}\n\n"
+        "Respond with the JSON object only."
+    )
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": user},
+    ]
+
+
+async def stream_phrase(words: str, user_context: str) -> AsyncIterator[str]:
+    """
+    Stream the phrase generation output from the LLM as it is produced.
+
+    CrewAI only returns the aggregated result, so this calls LiteLLM directly
+    (still traced by the LiteLLM instrumentor).
+
+    Args:
+        words: JSON-encoded list of words
+        user_context: JSON-encoded user context
+
+    Yields:
+        Text deltas of the JSON response
+    """
+    llm = default_llm()
+    response = await litellm.acompletion(
+        model=llm.model,
+        api_key=llm.api_key,
+        messages=phrase_messages(words, user_context),
+        stream=True,
+    )
+    async for chunk in response:
+        delta = chunk.choices[0].delta.content
+        if delta:
+            yield delta
@@ -0,0 +1,103 @@
+import asyncio
+import contextvars
+from typing import Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class AsyncBatcher(Generic[T, R]):
+    """
+    Collects concurrently submitted items and processes them in batches.
+
+    A batch is flushed when it reaches `max_batch` items or when the oldest
+    item has waited `max_latency_ms`, whichever comes first. If `key` is
+    given, only items with equal keys are batched together. The handler
+    receives the items of one batch and must return one result per item,
+    in the same order; an exception instance in place of a result fails
+    only that item.
+
+    A batch of one runs in the context of the call that submitted it, so
+    context variables such as the current tracing span carry over. Larger
+    batches run in an empty context so no single submitter's context (e.g.
+    the tracing session of whichever request arrived first) leaks into work
+    done on behalf of the others; handlers that need per-item context should
+    carry it in the items.
+
+    Usage:
+        async def handle(items: list[str]) -> list[str]:
+            ...
+
+        batcher = AsyncBatcher(handle, max_batch=16, max_latency_ms=25)
+        result = await batcher.submit("item")
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[T]], Awaitable[list[R | BaseException]]],
+        max_batch: int = 16,
+        max_latency_ms: float = 25,
+        key: Optional[Callable[[T], Hashable]] = None,
+    ):
+        self._handler = handler
+        self._max_batch = max_batch
+        self._max_latency = max_latency_ms / 1000
+        self._key = key
+        self._pending: dict[Hashable, list[tuple[T, asyncio.Future[R], contextvars.Context]]] = {}
+        self._flush_handles: dict[Hashable, asyncio.TimerHandle] = {}
+        self._running: set[asyncio.Task] = set()
+
+    async def submit(self, item: T) -> R:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[R] = loop.create_future()
+        key = self._key(item) if self._key is not None else None
+        pending = self._pending.setdefault(key, [])
+        pending.append((item, future, contextvars.copy_context()))
+
+        if len(pending) >= self._max_batch:
+            self._flush(key)
+        elif key not in self._flush_handles:
+            self._flush_handles[key] = loop.call_later(self._max_latency, self._flush, key)
+
+        return await future
+
+    def _flush(self, key: Hashable) -> None:
+        handle = self._flush_handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+
+        context = batch[0][2] if len(batch) == 1 else contextvars.Context()
+        task = asyncio.create_task(self._run(batch), context=context)
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: list[tuple[T, asyncio.Future[R], contextvars.Context]]) -> None:
+        try:
+            results = await self._handler([item for item, _, _ in batch])
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Check before resolving anything so no future is left pending
+        if len(results) != len(batch):
+            error = RuntimeError(
+                f"Batch handler returned {len(results)} results for {len(batch)} items"
+            )
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, future, _), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
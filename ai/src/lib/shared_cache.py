@@ -0,0 +1,55 @@
+import logging
+from typing import Optional
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class SharedCache:
+    """
+    Cache shared across worker processes, backed by Redis.
+
+    Every operation is best-effort: when no Redis URL is configured, or Redis
+    is unreachable, reads miss and writes are dropped, so callers simply fall
+    back to the source of truth. Connects and commands give up after
+    `timeout` seconds so a hanging Redis can't stall requests.
+
+    Usage:
+        cache = SharedCache(os.getenv("REDIS_URL"))
+        value = await cache.get("key")
+        await cache.set("key", b"value", ttl=60)
+    """
+
+    def __init__(self, url: Optional[str], timeout: float = 0.25):
+        self._redis = redis.Redis.from_url(
+            url,
+            decode_responses=False,
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout,
+        ) if url else None
+
+    async def get(self, key: str) -> Optional[bytes]:
+        if self._redis is None:
+            return None
+        try:
+            return await self._redis.get(key)
+        except RedisError as e:
+            logger.warning("Error reading shared cache: %s", e)
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        if self._redis is None:
+            return
+        try:
+            await self._redis.setex(key, ttl, value)
+        except RedisError as e:
+            logger.warning("Error writing shared cache: %s", e)
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+
+
+__all__ = ["SharedCache"]
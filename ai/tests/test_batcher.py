@@ -0,0 +1,154 @@
+import asyncio
+import contextvars
+
+import pytest
+
+from lib.batcher import AsyncBatcher
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="")
+
+
+class RecordingHandler:
+    """Batch handler that records every batch it receives and echoes the items back."""
+
+    def __init__(self):
+        self.batches: list[list] = []
+
+    async def __call__(self, items: list) -> list:
+        self.batches.append(list(items))
+        return [item * 10 for item in items]
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_batch_is_full():
+    handler = RecordingHandler()
+    batcher = AsyncBatcher(handler, max_batch=3, max_latency_ms=60_000)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.submit(i) for i in (1, 2, 3))),
+        timeout=1,
+    )
+
+    assert results == [10, 20, 30]
+    assert handler.batches == [[1, 2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_flushes_after_max_latency():
+    handler = RecordingHandler()
+    batcher = AsyncBatcher(handler, max_batch=100, max_latency_ms=10)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(batcher.submit(1), batcher.submit(2)),
+        timeout=1,
+    )
+
+    assert results == [10, 20]
+    assert handler.batches == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_groups_items_by_key():
+    handler = RecordingHandler()
+    batcher = AsyncBatcher(handler, max_batch=100, max_latency_ms=10, key=lambda item: item % 2)
+
+    results = await asyncio.gather(*(batcher.submit(i) for i in (1, 2, 3, 4)))
+
+    assert results == [10, 20, 30, 40]
+    assert sorted(handler.batches) == [[1, 3], [2, 4]]
+
+
+@pytest.mark.asyncio
+async def test_result_count_mismatch_fails_every_item():
+    async def handler(items: list) -> list:
+        return items[:-1]
+
+    batcher = AsyncBatcher(handler, max_batch=3, max_latency_ms=60_000)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.submit(i) for i in (1, 2, 3)), return_exceptions=True),
+        timeout=1,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_handler_exception_fails_every_item():
+    async def handler(items: list) -> list:
+        raise ValueError("boom")
+
+    batcher = AsyncBatcher(handler, max_batch=2, max_latency_ms=60_000)
+
+    results = await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_exception_result_fails_only_that_item():
+    async def handler(items: list) -> list:
+        return [ValueError(item) if item == 2 else item * 10 for item in items]
+
+    batcher = AsyncBatcher(handler, max_batch=3, max_latency_ms=60_000)
+
+    results = await asyncio.gather(*(batcher.submit(i) for i in (1, 2, 3)), return_exceptions=True)
+
+    assert results[0] == 10
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 30
+
+
+@pytest.mark.asyncio
+async def test_cancelled_submitter_does_not_break_batch():
+    handler = RecordingHandler()
+    batcher = AsyncBatcher(handler, max_batch=100, max_latency_ms=20)
+
+    tasks = [asyncio.create_task(batcher.submit(i)) for i in (1, 2, 3)]
+    await asyncio.sleep(0)
+    tasks[1].cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=1)
+
+    assert results[0] == 10
+    assert isinstance(results[1], asyncio.CancelledError)
+    assert results[2] == 30
+    assert handler.batches == [[1, 2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_single_item_batch_runs_in_submitter_context():
+    seen: list[str] = []
+
+    async def handler(items: list) -> list:
+        seen.append(request_id.get())
+        return items
+
+    batcher = AsyncBatcher(handler, max_batch=100, max_latency_ms=10, key=lambda item: item)
+
+    async def submit(item: str) -> str:
+        request_id.set(item)
+        return await batcher.submit(item)
+
+    await asyncio.gather(submit("a"), submit("b"))
+
+    assert sorted(seen) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_multi_item_batch_runs_in_empty_context():
+    seen: list[str] = []
+
+    async def handler(items: list) -> list:
+        seen.append(request_id.get())
+        return items
+
+    batcher = AsyncBatcher(handler, max_batch=2, max_latency_ms=60_000)
+
+    async def submit(item: str) -> str:
+        request_id.set(item)
+        return await batcher.submit(item)
+
+    await asyncio.gather(submit("a"), submit("b"))
+
+    assert seen == [""]